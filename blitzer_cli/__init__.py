@@ -18,8 +18,26 @@
 __version__ = "0.1.1"
 
 
+import sys
+
+# Submodules resolved lazily on attribute access, so `import blitzer_cli` stays cheap
+_SUBMODULES = ('cli', 'config', 'data_manager', 'processor', 'utils')
+
+
+def __getattr__(name):
+    """Import submodules on first access (PEP 562)."""
+    if name in _SUBMODULES:
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def cleanup_resources():
     """Cleanup all resources used by the blitzer-cli package."""
+    # Nothing to release if the processor was never loaded this run; importing
+    # it just to clean up would pull in sqlite3 for --help and `languages`
+    if 'blitzer_cli.processor' not in sys.modules:
+        return
     from blitzer_cli.processor import cleanup_db_connections
     # from blitzer_cli.data_manager import cleanup_language_data
     
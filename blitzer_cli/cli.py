@@ -20,15 +20,17 @@ Minimalist CLI tool for language text processing.
 Accepts text via stdin and outputs word lists via stdout.
 """
 
-import re
+import os
 import sys
-import subprocess
 import click
-from blitzer_cli.processor import process_text, get_available_languages
 from blitzer_cli.config import load_config
 from blitzer_cli.utils import print_error
 
 
+# Config keys holding the defaults for --lemmatize, --freq, --context, --prompt and --src
+_FLAG_DEFAULT_KEYS = ('default_lemmatize', 'default_freq', 'default_context', 'default_prompt', 'default_src')
+
+
 @click.group(invoke_without_command=False)
 def cli():
     """Blitzer CLI: Vocabulary extraction for language learners."""
@@ -46,9 +48,31 @@ def cli():
 @click.option("--no-config", "-n", is_flag=True, default=False, help="Don't load any config file, use built-in defaults only.")
 @click.option("--config", "-C", type=click.Path(exists=True), help="Use specific config file instead of default.")
 @click.option("--exclusion", "-e", multiple=True, help="Specify exclusion list for a language (format: language_code:/path/to/exclusion.txt). Can be used multiple times.")
-def blitz(text, language_code, lemmatize, freq, context, prompt, src, no_config, config, exclusion):
+@click.option("--top", type=click.IntRange(min=1), default=None, help="Only list the N most frequent words.")
+def blitz(text, language_code, lemmatize, freq, context, prompt, src, no_config, config, exclusion, top):
+    # Process exclusion overrides
+    # The processor is imported here so --help and `languages` never load it
+    from .processor import process_text, set_exclusion_override
+    overridden_languages = set()
+    for excl in exclusion:
+        if ':' in excl:
+            parts = excl.split(':', 1)  # Split only on first ':'
+            lang_code = parts[0].strip()
+            excl_path = parts[1].strip()
+            set_exclusion_override(lang_code, excl_path)
+            overridden_languages.add(lang_code)
+        else:
+            print_error(f"Invalid exclusion format: {excl}. Use language_code:/path/to/file.txt")
+            raise click.Abort()
+
+    # The config only supplies flag defaults and the exclusion path, so it can be
+    # skipped entirely when the command line already provides all of them
+    flags = (lemmatize, freq, context, prompt, src)
+    needs_config = (language_code not in overridden_languages
+                    or any(flag is None for flag in flags))
+
     # Load config based on flags
-    if no_config:
+    if no_config or not needs_config:
         # Don't load any config, use empty dict to indicate no config mode
         config_dict = {}
     elif config:
@@ -59,25 +83,13 @@ def blitz(text, language_code, lemmatize, freq, context, prompt, src, no_config,
         config_dict = load_config()
    
     # Use config defaults if CLI flags weren't explicitly set
-    lemmatize = lemmatize if lemmatize is not None else config_dict.get('default_lemmatize', False)
-    freq = freq if freq is not None else config_dict.get('default_freq', False)
-    context = context if context is not None else config_dict.get('default_context', False)
-    prompt = prompt if prompt is not None else config_dict.get('default_prompt', False)
-    src = src if src is not None else config_dict.get('default_src', False)
+    get_default = config_dict.get
+    lemmatize, freq, context, prompt, src = [
+        flag if flag is not None else get_default(key, False)
+        for flag, key in zip(flags, _FLAG_DEFAULT_KEYS)
+    ]
 
-    # Process exclusion overrides
-    from .processor import set_exclusion_override
-    for excl in exclusion:
-        if ':' in excl:
-            parts = excl.split(':', 1)  # Split only on first ':'
-            lang_code = parts[0].strip()
-            excl_path = parts[1].strip()
-            set_exclusion_override(lang_code, excl_path)
-        else:
-            print_error(f"Invalid exclusion format: {excl}. Use language_code:/path/to/file.txt")
-            raise click.Abort()
-
-    input_text = text.strip() if text else sys.stdin.read().strip()
+    input_text = text.strip() if text else read_stdin()
 
     if not input_text:
         print_error("No input text provided.")
@@ -94,77 +106,116 @@ def blitz(text, language_code, lemmatize, freq, context, prompt, src, no_config,
             context_flag=context,
             prompt_flag=prompt,
             src_flag=src,
+            top_n=top,
         )
 
-        # Output to stdout
-        print(output, end="")
+        write_output(output)
 
     except Exception as e:
         print_error(f"Error processing text: {e}")
         sys.exit(1)
 
 
+def write_output(output: str) -> None:
+    """Write the finished output to stdout as one encoded payload."""
+    stream = sys.stdout
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:
+        # Text-only streams (e.g. some embedding hosts) have no byte layer
+        stream.write(output)
+        return
+    # Writing to the byte layer skips the text layer's newline translation, so
+    # apply it here the way a default stdout would (CRLF on Windows)
+    if os.linesep != '\n':
+        output = output.replace('\n', os.linesep)
+    # Flush anything already written through the text layer to keep ordering
+    stream.flush()
+    buffer.write(output.encode(stream.encoding or 'utf-8', stream.errors or 'strict'))
+
+
+_WHITESPACE_BYTES = b" \t\n\r\x0b\x0c"
+
+
+def read_stdin() -> str:
+    """Read stdin as UTF-8 with surrounding whitespace trimmed, like str.strip().
+
+    Bytes that are not valid UTF-8 are decoded as U+FFFD rather than aborting the run.
+    """
+    buffer = getattr(sys.stdin, 'buffer', None)
+    if buffer is None:
+        # Text-only streams (e.g. some embedding hosts) are already decoded
+        return sys.stdin.read().strip()
+    raw = buffer.read()
+    start, end = 0, len(raw)
+    while start < end and raw[start] in _WHITESPACE_BYTES:
+        start += 1
+    while end > start and raw[end - 1] in _WHITESPACE_BYTES:
+        end -= 1
+    # Trimming ASCII whitespace on the bytes avoids copying the payload; strip()
+    # then catches Unicode whitespace such as NBSP and returns the same string
+    # object when there is nothing left to remove
+    return str(memoryview(raw)[start:end], 'utf-8', 'replace').strip()
+
+
 def validate_language_code(language_code: str) -> bool:
     """Validate language code format to prevent injection."""
     if not language_code:
         return False
-    # Require 3-letter ISO 639 language codes
-    return bool(re.match(r'^[a-z]{3}$', language_code))
+    # Require 3-letter ISO 639 language codes: exactly three ASCII lowercase letters
+    return (len(language_code) == 3 and language_code.isascii()
+            and language_code.isalpha() and language_code.islower())
 
 
 @cli.command("languages", help="Manage language packs.")
 @click.argument('action', type=click.Choice(['install', 'uninstall', 'list']))
-@click.argument('language_code', required=False)
-def manage_languages(action, language_code):
+@click.argument('language_codes', nargs=-1)
+def manage_languages(action, language_codes):
     if action == 'list':
+        from .processor import get_available_languages
         for lang in get_available_languages():
             click.echo(lang)
-    elif action in ['install', 'uninstall']:
-        if not language_code:
-            print_error("Please specify a language code to install.")
-            raise click.Abort()
-        
-        # Validate the language code to prevent injection
-        if not validate_language_code(language_code):
-            print_error(f"Invalid language code format: {language_code}. Use 3 lowercase letters (ISO 639-3).")
-            raise click.Abort()
-        
-        package_name = f"blitzer-language-{language_code}"
-        click.echo(f"Installing language pack: {package_name}")
-        
-        try:
-            result = subprocess.run([sys.executable, "-m", "pip",
-                                     "install", package_name],
-                                    capture_output=True, text=True, check=True)
-            click.echo(f"Successfully installed {package_name}")
-            click.echo(result.stdout)
-        except subprocess.CalledProcessError as e:
-            print_error(f"Failed to install {package_name}: {e}")
-            print_error(e.stderr)
-            sys.exit(1)
-    elif action == 'uninstall':
-        if not language_code:
-            print_error("Please specify a language code to uninstall.")
-            raise click.Abort()
+        return
 
-        # Validate the language code to prevent injection
+    if not language_codes:
+        print_error(f"Please specify a language code to {action}.")
+        raise click.Abort()
+
+    # Validate the language codes to prevent injection
+    for language_code in language_codes:
         if not validate_language_code(language_code):
             print_error(f"Invalid language code format: {language_code}. Use 3 lowercase letters (ISO 639-3).")
             raise click.Abort()
 
-        package_name = f"blitzer-language-{language_code}"
-        click.echo(f"Uninstalling language pack: {package_name}")
-
-        try:
-            result = subprocess.run([sys.executable, "-m", "pip",
-                                     "uninstall", "-y", package_name],
-                                    capture_output=True, text=True, check=True)
-            click.echo(f"Successfully uninstalled {package_name}")
-            click.echo(result.stdout)
-        except subprocess.CalledProcessError as e:
-            print_error(f"Failed to uninstall {package_name}: {e}")
-            print_error(e.stderr)
-            sys.exit(1)
+    package_names = [f"blitzer-language-{code}" for code in language_codes]
+    packages = ", ".join(package_names)
+
+    # Hand every pack to a single pip process to pay its startup cost only once
+    if action == 'install':
+        pip_args = ["install", *package_names]
+        click.echo(f"Installing language packs: {packages}")
+    else:
+        pip_args = ["uninstall", "-y", *package_names]
+        click.echo(f"Uninstalling language packs: {packages}")
+
+    import subprocess
+    try:
+        # pip inherits our stdout/stderr so its progress streams live instead of
+        # being buffered in memory; skip its self-update check, which can cost
+        # a network round trip per run
+        subprocess.run([sys.executable, "-m", "pip", "--disable-pip-version-check", *pip_args],
+                       check=True)
+        click.echo(f"Successfully {action}ed {packages}")
+        # Only a processor already loaded in this process (e.g. an embedding
+        # host) has cached language lookups; otherwise skip importing it
+        processor = sys.modules.get('blitzer_cli.processor')
+        if processor is not None:
+            import importlib
+            # Let the import system see the new or removed plugin modules too
+            importlib.invalidate_caches()
+            processor.clear_language_cache()
+    except subprocess.CalledProcessError as e:
+        print_error(f"Failed to {action} {packages}: {e}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -16,18 +16,57 @@
 
 """Configuration management using XDG specifications."""
 
+import copy
+import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
-# Import TOML library with fallback for older Python versions
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # Python < 3.11
+_DEFAULT_CONFIG_TEXT = """# Blitzer CLI Configuration
+# This file uses TOML format
+
+# Default flag values
+default_lemmatize = false  # Default value for --lemmatize/-L flag
+default_freq = false       # Default value for --freq/-f flag
+default_context = false    # Default value for --context/-c flag
+default_prompt = false     # Default value for --prompt/-p flag
+default_src = false        # Default value for --src/-s flag
+
+# Language-specific exclusion list paths
+# Each key in the exclusions table represents a language code with its exclusion file path
+# Example: "slv" = "/path/to/slovenian_exclusion.txt"
+# Example: "pli" = "/path/to/pali_exclusion.txt"
+[exclusions]
+
+# Language-specific prompts
+# Each key in the prompts table represents a language code with its custom prompt
+[prompts]
+"base" = "Convert the following wordlist into tab separated anki cards."
+"en" = "Convert the following wordlist into tab separated anki cards."
+
+"""
+
+# _DEFAULT_CONFIG_TEXT as parsed, returned on first run instead of re-reading the file
+_DEFAULT_CONFIG = {
+    'default_lemmatize': False,
+    'default_freq': False,
+    'default_context': False,
+    'default_prompt': False,
+    'default_src': False,
+    'exclusions': {},
+    'prompts': {
+        'base': "Convert the following wordlist into tab separated anki cards.",
+        'en': "Convert the following wordlist into tab separated anki cards.",
+    },
+}
+
+# Parsed copy of the default config file, reused across runs while config.toml is unchanged
+_SNAPSHOT_FILENAME = 'config.cache.json'
 
 
+@lru_cache(maxsize=1)
 def get_config_dir():
-    """Get the XDG config directory for blitzer."""
+    """Get the XDG config directory for blitzer (resolved once per process)."""
     # Use XDG_CONFIG_HOME or default to ~/.config
     xdg_config_home = os.environ.get('XDG_CONFIG_HOME')
     if xdg_config_home:
@@ -38,6 +77,69 @@ def get_config_dir():
     return config_dir
 
 
+def _parse_toml(config_file):
+    """Parse a TOML file, importing the parser only when it is actually needed."""
+    # Import TOML library with fallback for older Python versions
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        import tomli as tomllib  # Python < 3.11
+
+    with open(config_file, 'rb') as f:
+        return tomllib.load(f)
+
+
+def _load_snapshot(snapshot_file, source):
+    """Return the snapshotted config if it was taken from exactly this source file."""
+    try:
+        with open(snapshot_file, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('source') != source:
+        return None
+    return snapshot.get('config')
+
+
+def _save_snapshot(snapshot_file, source, config):
+    """Store the parsed config as JSON; failing to do so is never an error."""
+    try:
+        payload = json.dumps({'source': source, 'config': config})
+        with open(snapshot_file, 'w', encoding='utf-8') as f:
+            f.write(payload)
+    except (OSError, TypeError, ValueError):
+        # TypeError covers TOML values JSON cannot hold (e.g. datetimes)
+        pass
+
+
+@lru_cache(maxsize=8)
+def _parse_config(config_file, mtime_ns, size, snapshot_file=None):
+    """Parse a TOML config file, memoized on its path, mtime and size.
+
+    With a snapshot file, the parsed result is also persisted as JSON so later
+    runs can skip the TOML parser while the source file is unchanged.
+    """
+    source = [config_file, mtime_ns, size]
+    if snapshot_file:
+        config = _load_snapshot(snapshot_file, source)
+        if config is not None:
+            return config
+
+    config = _parse_toml(config_file)
+    if snapshot_file:
+        _save_snapshot(snapshot_file, source, config)
+    return config
+
+
+def _read_config(config_file, snapshot_file=None):
+    """Return the parsed config file, re-parsing only when it changed on disk."""
+    stat = os.stat(config_file)
+    config = _parse_config(str(config_file), stat.st_mtime_ns, stat.st_size,
+                           str(snapshot_file) if snapshot_file else None)
+    # The cached dict is shared, so hand each caller its own copy to modify
+    return copy.deepcopy(config)
+
+
 def load_config(config_path=None, use_default_config=True):
     """Load configuration from XDG config file or specific path.
     
@@ -48,31 +150,27 @@ def load_config(config_path=None, use_default_config=True):
     if config_path:
         # Use the provided config path
         config_file = Path(config_path)
+        snapshot_file = None
     else:
         # Use default XDG config location
         config_dir = get_config_dir()
         config_file = config_dir / 'config.toml'
-        
-        # Create config directory if it doesn't exist (only for default location)
-        if use_default_config:
-            config_dir.mkdir(parents=True, exist_ok=True)
+        snapshot_file = config_dir / _SNAPSHOT_FILENAME
     
     # Load the config
     try:
-        with open(config_file, 'rb') as f:
-            return tomllib.load(f)
+        return _read_config(config_file, snapshot_file)
     except Exception:
         if use_default_config and config_path is None:
             # If config doesn't exist or fails to load, create default and reload
             if not config_file.exists():
+                # The directory is only needed when the default file is written,
+                # so an existing config costs no mkdir call
+                config_file.parent.mkdir(parents=True, exist_ok=True)
                 create_default_config(config_file)
-                # Now load the newly created config
-                try:
-                    with open(config_file, 'rb') as f:
-                        return tomllib.load(f)
-                except Exception:
-                    # If it still fails after creating default, return empty config
-                    return {}
+                # The file was just written from _DEFAULT_CONFIG_TEXT, so hand back
+                # its parsed form instead of reading and parsing it again
+                return copy.deepcopy(_DEFAULT_CONFIG)
             else:
                 # If file exists but loading failed for other reasons, return empty config
                 return {}
@@ -83,29 +181,4 @@ def load_config(config_path=None, use_default_config=True):
 
 def create_default_config(config_file):
     """Create a default configuration file."""
-    default_config = """# Blitzer CLI Configuration
-# This file uses TOML format
-
-# Default flag values
-default_lemmatize = false  # Default value for --lemmatize/-L flag
-default_freq = false       # Default value for --freq/-f flag
-default_context = false    # Default value for --context/-c flag
-default_prompt = false     # Default value for --prompt/-p flag
-default_src = false        # Default value for --src/-s flag
-
-# Language-specific exclusion list paths
-# Each key in the exclusions table represents a language code with its exclusion file path
-# Example: "slv" = "/path/to/slovenian_exclusion.txt"
-# Example: "pli" = "/path/to/pali_exclusion.txt"
-[exclusions]
-
-# Language-specific prompts
-# Each key in the prompts table represents a language code with its custom prompt
-[prompts]
-"base" = "Convert the following wordlist into tab separated anki cards."
-"en" = "Convert the following wordlist into tab separated anki cards."
-
-"""
-    
-    with open(config_file, 'w', encoding='utf-8') as f:
-        f.write(default_config)
+    Path(config_file).write_text(_DEFAULT_CONFIG_TEXT, encoding='utf-8')
@@ -16,19 +16,38 @@
 
 """Data management utilities for language packs."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-import requests
 from typing import Optional
 from blitzer_cli.config import get_config_dir
 from blitzer_cli.utils import print_error
 
 
+# Download chunk size, also used as the file write buffer size
+_CHUNK_SIZE = 64 * 1024
+
+# Directories already created by this process, so mkdir runs at most once each
+_created_dirs = set()
+
+
+@lru_cache(maxsize=None)
+def _language_data_path(language_code: str) -> Path:
+    """Resolve the data directory for a language without touching the filesystem."""
+    return get_config_dir() / "language_data" / language_code
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory the first time it is requested in this process."""
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+    return path
+
+
 def get_language_data_dir(language_code: str) -> Path:
     """Get the data directory for a specific language."""
-    config_dir = get_config_dir()
-    data_dir = config_dir / "language_data" / language_code
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir
+    return _ensure_dir(_language_data_path(language_code))
 
 
 def download_language_data(url: str, language_code: str, filename: str) -> Path:
@@ -36,12 +55,25 @@ def download_language_data(url: str, language_code: str, filename: str) -> Path:
     data_dir = get_language_data_dir(language_code)
     filepath = data_dir / filename
     
-    print(f"Downloading {filename} for language {language_code}...")
-    response = requests.get(url)
-    response.raise_for_status()
+    # Download next to the target and rename when complete, so an interrupted
+    # transfer never leaves a truncated file that looks like valid data
+    partial_path = filepath.with_name(filepath.name + ".part")
     
-    with open(filepath, 'wb') as f:
-        f.write(response.content)
+    # requests and its dependencies are slow to import, so only pay for them
+    # when something is actually downloaded
+    import requests
+    
+    print(f"Downloading {filename} for language {language_code}...")
+    try:
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            with open(partial_path, 'wb', buffering=_CHUNK_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    f.write(chunk)
+        os.replace(partial_path, filepath)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
     
     print(f"Downloaded to {filepath}")
     return filepath
@@ -83,6 +115,9 @@ def cleanup_language_data(language_code: Optional[str] = None) -> None:
     if not data_dir.exists():
         return  # Nothing to clean up
     
+    # Removed directories must be recreated on next use
+    _created_dirs.clear()
+    
     if language_code:
         # Clean up data for specific language
         lang_data_dir = data_dir / language_code
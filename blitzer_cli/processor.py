@@ -16,12 +16,15 @@
 
 """New core text processing functionality following the specified architecture."""
 
+import atexit
 import re
-import sqlite3
+import unicodedata
 from collections import Counter
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Callable
 
 from blitzer_cli.utils import print_warning
 
@@ -29,20 +32,80 @@ from blitzer_cli.utils import print_warning
 # In-memory cache for database connections (per language)
 _db_cache = {}
 
+# Specs returned by each plugin's register(), per language code
+_language_spec_cache = {}
+
+# Lemmas already looked up, per database and keyed by lowercased form. Lemmas
+# are kept as tuples so callers cannot change them through a returned mapping;
+# forms the database does not know map to None so they are not queried again.
+_lemma_cache = {}
+
+# Upper bound on cached forms per database before its cache is reset
+_LEMMA_CACHE_MAX = 50000
+
+# Connection tuning for the read-only lemma lookups: 64 MiB page cache,
+# in-memory temp tables and a memory-mapped database file
+_CONNECTION_PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Words for the fallback tokenizer, found in text already passed through
+# _LETTER_TABLE: a letter followed by any further letters and combining marks,
+# everything else having been blanked to a space
+_WORD_RE = re.compile(r"[^\W\d_][^ ]*")
+
+# Whitespace after sentence-ending punctuation, unless it follows an initial
+# ("J.") or a short abbreviation ("Mr."). The cheap punctuation look-behind
+# comes first so most positions are rejected before the abbreviation checks.
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])(?<!\b[A-Z]\.)(?<!\b[A-Z][a-z]\.)\s+")
+
+# Byte table mapping every ASCII non-letter to a space, for the ASCII fast path
+_ASCII_NON_LETTERS = bytes(
+    byte if (0x41 <= byte <= 0x5A or 0x61 <= byte <= 0x7A) else 0x20
+    for byte in range(256)
+)
+
+
+class _LetterTable(dict):
+    """str.translate table keeping letters (L*) and combining marks (Mn, Mc).
+
+    Every other character, including numeric symbols such as "²", "½" and "Ⅻ"
+    that re counts as word characters, maps to a space. Entries are filled in
+    the first time a character is seen.
+    """
+
+    def __missing__(self, code_point: int) -> int:
+        category = unicodedata.category(chr(code_point))
+        value = code_point if category[0] == 'L' or category in ('Mn', 'Mc') else 0x20
+        self[code_point] = value
+        return value
+
+
+_LETTER_TABLE = _LetterTable()
+
+
+def _find_words(text: str) -> List[str]:
+    """Return the words in text: letters of any script with their combining marks."""
+    if text.isascii():
+        # Blanking out non-letters and splitting on whitespace runs entirely in C
+        # and is several times faster than the regex engine on ASCII input
+        return text.encode('ascii').translate(_ASCII_NON_LETTERS).decode('ascii').split()
+    # Combining marks are not word characters to re, so "धम्म" would split at
+    # the virama; blank everything else first and let marks continue a word
+    return _WORD_RE.findall(text.translate(_LETTER_TABLE))
+
 
 def regex_tokenize(text: str) -> List[str]:
-    """Core fallback tokenizer using the standard re library with improved Unicode support."""
-    import re
-    # Use a space-based split first, then refine to handle punctuation within words
-    # This approach better preserves international characters
-    words = text.lower().split()
-    tokens = []
-    for word in words:
-        # Extract sequences of letter characters (Unicode-aware)
-        # This handles punctuation and special characters around words
-        extracted = re.findall(r"[a-zA-Z\u00C0-\u017F\u0100-\u024F\u1E00-\u1EFF]+", word)
-        tokens.extend(extracted)
-    return tokens
+    """Core fallback tokenizer using the standard re library with improved Unicode support.
+
+    Always returns lowercase tokens, whatever the case of the input.
+    """
+    # Extract sequences of letter characters, which handles punctuation and special
+    # characters around words. Whitespace is never part of the character class, so
+    # one scan over the whole text yields the same tokens as scanning word by word.
+    return _find_words(text.lower())
 
 
 def process_text(
@@ -54,6 +117,7 @@ def process_text(
     context_flag: bool = False,
     prompt_flag: bool = False,
     src_flag: bool = False,
+    top_n: Optional[int] = None,
 ) -> str:
     """Process text according to specified flags following the new architecture."""
     # Set the current config for this processing session
@@ -66,7 +130,7 @@ def process_text(
     if prompt_flag:
         prompt_text = get_language_prompt(language_code)
         if not prompt_text:
-            print("\033[31mWARNING: No language-specific prompt configured for this language. Ignoring --prompt flag.\033[0m", file=sys.stderr)
+            print_warning("No language-specific prompt configured for this language. Ignoring --prompt flag.")
             prompt_flag = False
     
     # 1. Normalization
@@ -77,9 +141,20 @@ def process_text(
     
     # 2. Tokenization  
     if language_spec.get("tokenizer"):
-        original_tokens = language_spec["tokenizer"](normalized_text)
+        tokenize = language_spec["tokenizer"]
+    elif language_spec.get("normalizer"):
+        tokenize = regex_tokenize
     else:
-        original_tokens = regex_tokenize(normalized_text)
+        # Default normalization already lowercased the text, so skip regex_tokenize's
+        # second full-text lower() pass
+        tokenize = _find_words
+    original_tokens = tokenize(normalized_text)
+    
+    # Share one string object per distinct token. Natural text repeats a small
+    # vocabulary, so this shrinks the retained token list several-fold and lets
+    # later dict lookups match on identity.
+    canonical = {}
+    original_tokens = list(map(canonical.setdefault, original_tokens, original_tokens))
     
     # 3. Lemmatization (only if --lemmatize/-L and valid database provided)
     processed_tokens = []
@@ -104,7 +179,7 @@ def process_text(
         processed_tokens = all_lemmas  # Use all lemmas, not just unique ones, to preserve multiple mappings
     elif lemmatize_flag:
         # If lemmatize flag is set but no lemmatizer available, issue warning and continue with original tokens
-        print(f"\033[31mWARNING: No lemmatizer available for language {language_code}. Proceeding without lemmatization.\033[0m", file=sys.stderr)
+        print_warning(f"No lemmatizer available for language {language_code}. Proceeding without lemmatization.")
         processed_tokens = original_tokens
         # Map each original token to itself as a single-element list
         original_to_all_lemmas_map = {token: [token] for token in original_tokens}
@@ -126,7 +201,9 @@ def process_text(
         context_flag, 
         prompt_flag, 
         src_flag,
-        language_code
+        language_code,
+        tokenize,
+        top_n
     )
 
 
@@ -141,15 +218,17 @@ def get_language_spec(language_code: str) -> Dict[str, Any]:
             "custom_lemmatizer": None
         }
     
-    # Use the consistent function for entry points
-    language_eps = get_entry_points()
+    # Loading a plugin imports its package, so do it once per language
+    if language_code in _language_spec_cache:
+        return _language_spec_cache[language_code]
     
-    for ep in language_eps:
-        if ep.name == language_code:
-            register_func = ep.load()
-            return register_func()
+    ep = _get_language_eps().get(language_code)
+    if ep is None:
+        raise ValueError(f"Unsupported language: {language_code}")
     
-    raise ValueError(f"Unsupported language: {language_code}")
+    register_func = ep.load()
+    spec = _language_spec_cache[language_code] = register_func()
+    return spec
 
 
 @contextmanager
@@ -159,7 +238,14 @@ def get_db_connection(db_path: str):
         conn = _db_cache[db_path]
         yield conn
     else:
-        conn = sqlite3.connect(db_path)
+        # sqlite3 is only needed for lemmatization, so plain word lists never load it
+        import sqlite3
+        
+        # Language packs only read their lexicon, so open it read-only. This also
+        # skips write locking and never creates an empty database for a bad path.
+        conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         _db_cache[db_path] = conn
         try:
             yield conn
@@ -169,7 +255,7 @@ def get_db_connection(db_path: str):
             pass
 
 
-def sql_lemmatize_tokens_with_mapping(tokens: List[str], db_path: str) -> tuple[List[str], Dict[str, List[str]]]:
+def sql_lemmatize_tokens_with_mapping(tokens: List[str], db_path: str) -> Tuple[List[str], Dict[str, List[str]]]:
     """Lemmatize tokens using SQLite database lookup with in-memory caching and return mapping from original tokens to all possible lemmas."""
     global _db_cache
     
@@ -179,51 +265,62 @@ def sql_lemmatize_tokens_with_mapping(tokens: List[str], db_path: str) -> tuple[
     with get_db_connection(db_path) as conn:
         cursor = conn.cursor()
         
-        # Create mapping to preserve original tokens and their order
-        token_to_lower = {token: token.lower() for token in tokens}
-        unique_tokens = list(set(token_to_lower.values()))
-        
-        # Create a temporary table approach for batch lookup
-        # First, create a temporary table with all the tokens we need to look up
-        cursor.execute("CREATE TEMP TABLE temp_lookup (form TEXT)")
-        
-        # Insert all unique tokens into the temp table
-        cursor.executemany("INSERT INTO temp_lookup (form) VALUES (?)", [(token,) for token in unique_tokens])
+        # Repeated tokens need only one lookup, so work on the distinct ones
+        # dict.fromkeys dedupes in C and, unlike set, keeps first-seen order, so
+        # forms always reach the database in the same order
+        token_to_lower = {token: token.lower() for token in dict.fromkeys(tokens)}
+        unique_tokens = list(dict.fromkeys(token_to_lower.values()))
         
-        # Perform a single JOIN query to get all lemmas at once
-        cursor.execute("""
-            SELECT tl.form, l.lemma 
-            FROM temp_lookup tl
-            JOIN Forms f ON f.form_representation = tl.form COLLATE NOCASE
-            JOIN Lemmas l ON l.id = f.lemma_id
-        """)
+        # Only forms not seen in an earlier call need to go to the database
+        form_cache = _lemma_cache.setdefault(db_path, {})
+        missing_tokens = [token for token in unique_tokens if token not in form_cache]
+        if len(form_cache) + len(missing_tokens) > _LEMMA_CACHE_MAX:
+            form_cache.clear()
+            missing_tokens = unique_tokens
         
-        # Group the results by form
-        form_to_lemmas = {}
-        for form, lemma in cursor.fetchall():
-            if form not in form_to_lemmas:
-                form_to_lemmas[form] = []
-            form_to_lemmas[form].append(lemma)
+        if missing_tokens:
+            # Stage the forms in a temporary table, created once per connection and
+            # emptied after each lookup, so no DDL runs on repeated calls
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS temp_lookup (form TEXT)")
+            cursor.executemany("INSERT INTO temp_lookup (form) VALUES (?)", [(token,) for token in missing_tokens])
+            
+            # Fetch all lemmas in one query. With the case-insensitive comparison
+            # on the Forms column, SQLite can probe a NOCASE index on
+            # form_representation when the pack ships one, and otherwise scans
+            # Forms once against an index it builds over the staged forms.
+            cursor.execute("""
+                SELECT f.form_representation, l.lemma
+                FROM Forms f
+                JOIN Lemmas l ON l.id = f.lemma_id
+                WHERE f.form_representation COLLATE NOCASE IN (SELECT form FROM temp_lookup)
+            """)
+            
+            # Group the results by the lowercased form they were matched for
+            form_to_lemmas = {}
+            for form, lemma in cursor.fetchall():
+                form = form.lower()
+                if form not in form_to_lemmas:
+                    form_to_lemmas[form] = []
+                form_to_lemmas[form].append(lemma)
+            
+            # Empty the staging table and end the implicit transaction the insert
+            # opened, so the cached connection does not keep the database locked
+            cursor.execute("DELETE FROM temp_lookup")
+            conn.commit()
+            
+            for token in missing_tokens:
+                lemmas = form_to_lemmas.get(token)
+                form_cache[token] = tuple(lemmas) if lemmas else None
         
-        # Drop the temporary table
-        cursor.execute("DROP TABLE temp_lookup")
+        # Map each distinct token to ALL its lemmas, or to itself if it was not found in DB.
+        # Each token gets a fresh list so the caller may modify the mapping freely.
+        original_to_all_lemmas_map = {
+            token: list(form_cache[lower_token] or (token,))
+            for token, lower_token in token_to_lower.items()
+        }
         
-        # Build the result list with ALL possible lemmas
-        all_lemmas = []
-        original_to_all_lemmas_map = {}
-        for token in tokens:
-            lower_token = token_to_lower[token]
-            if lower_token in form_to_lemmas:
-                lemmas = form_to_lemmas[lower_token]
-                # Add all lemmas to our list of all possible lemmas
-                all_lemmas.extend(lemmas)
-                # Map original token to list of ALL its lemmas
-                original_to_all_lemmas_map[token] = lemmas
-            else:
-                # Token was not found in DB, add the original token
-                all_lemmas.append(token)
-                # Map the original token to itself as a list
-                original_to_all_lemmas_map[token] = [token]
+        # Fan the lemmas back out to every occurrence, in token order
+        all_lemmas = list(chain.from_iterable(map(original_to_all_lemmas_map.__getitem__, tokens)))
         
         return all_lemmas, original_to_all_lemmas_map
 
@@ -234,9 +331,6 @@ def sql_lemmatize_tokens(tokens: List[str], db_path: str) -> List[str]:
     return processed_tokens
 
 
-def get_exclusion_terms(language_code: str) -> set:
-    """Get exclusion terms for the language using config to determine path."""
-    from .config import load_config
 # Global variables to hold current execution context (set by CLI)
 _exclusion_overrides = {}
 _current_config = {}
@@ -254,20 +348,12 @@ def set_current_config(config: dict) -> None:
     _current_config = config
 
 
-def get_exclusion_terms(language_code: str) -> set:
+def get_exclusion_terms(language_code: str) -> frozenset:
     """Get exclusion terms for the language."""
     
     # Check if there's an exclusion override for this language (from -e flag)
     if language_code in _exclusion_overrides:
-        exclusion_path_str = _exclusion_overrides[language_code]
-        exclusion_path = Path(exclusion_path_str).expanduser()
-        exclusion_terms = set()
-        if exclusion_path.exists():
-            with open(exclusion_path, "r", encoding="utf-8") as f:
-                exclusion_terms = {line.strip().lower() for line in f if line.strip()}
-        else:
-            print_warning(f"Exclusion file does not exist: {exclusion_path_str}")
-        return exclusion_terms
+        return _load_exclusion_file(_exclusion_overrides[language_code])
     
     # No override, check current config (only from CLI, not default loading)
     global _current_config
@@ -275,28 +361,38 @@ def get_exclusion_terms(language_code: str) -> set:
     if not _current_config:
         # No config was loaded (e.g., --no-config was used)
         # In this case, don't show warning since this is expected behavior
-        return set()
+        return frozenset()
     
     # Get exclusion file path from the config that was loaded via CLI
     exclusions_config = _current_config.get('exclusions', {})
     exclusion_path_str = exclusions_config.get(language_code)
     
-    exclusion_terms = set()
-    
     if exclusion_path_str:
-        # Use the path from config, expanding user home directory if needed
-        exclusion_path = Path(exclusion_path_str).expanduser()
-        if exclusion_path.exists():
-            with open(exclusion_path, "r", encoding="utf-8") as f:
-                exclusion_terms = {line.strip().lower() for line in f if line.strip()}
-        else:
-            print_warning(f"Exclusion file does not exist: {exclusion_path_str}")
-    else:
-        # If no exclusion path is specified in config, don't issue a warning
-        # since this is expected behavior for many languages
-        pass
+        return _load_exclusion_file(exclusion_path_str)
     
-    return exclusion_terms
+    # If no exclusion path is specified in config, don't issue a warning
+    # since this is expected behavior for many languages
+    return frozenset()
+
+
+def _load_exclusion_file(exclusion_path_str: str) -> frozenset:
+    """Read an exclusion file into a lowercased set for constant-time lookups."""
+    # Expand user home directory if needed
+    exclusion_path = Path(exclusion_path_str).expanduser()
+    try:
+        stat = exclusion_path.stat()
+    except OSError:
+        print_warning(f"Exclusion file does not exist: {exclusion_path_str}")
+        return frozenset()
+    return _read_exclusion_file(exclusion_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _read_exclusion_file(exclusion_path: Path, mtime_ns: int, size: int) -> frozenset:
+    """Parse an exclusion file, cached until its modification time or size changes."""
+    # Read and lowercase the whole file at once rather than line by line
+    lines = exclusion_path.read_text(encoding="utf-8").lower().splitlines()
+    return frozenset(term for term in map(str.strip, lines) if term)
 
 
 def get_language_prompt(language_code: str) -> Optional[str]:
@@ -325,17 +421,29 @@ def get_entry_points():
             return eps.get('blitzer.languages', [])
 
 
+@lru_cache(maxsize=1)
+def _get_language_eps() -> Dict[str, Any]:
+    """Map each installed plugin's language code to its entry point, scanning metadata once."""
+    language_eps = {}
+    for ep in get_entry_points():
+        # Keep the first plugin registered for a code
+        language_eps.setdefault(ep.name, ep)
+    return language_eps
+
+
 def _format_output(
     tokens: List[str], 
     original_tokens: List[str], 
     original_to_processed_map: Dict[str, List[str]],  # Changed to List[str] values
     normalized_text: str, 
-    excluded_terms: set,
+    excluded_terms: frozenset,
     freq_flag: bool, 
     context_flag: bool, 
     prompt_flag: bool, 
     src_flag: bool,
-    language_code: str
+    language_code: str,
+    tokenize: Callable[[str], List[str]] = _find_words,
+    top_n: Optional[int] = None
 ) -> str:
     """Format output based on flags."""
     
@@ -350,42 +458,64 @@ def _format_output(
             result_lines.extend(["PROMPT:", "", prompt_text, "", "------", "******", "------", ""])
     
     # Get token counts for frequency calculations using processed tokens
-    token_counts = Counter(token for token in tokens if token.lower() not in excluded_terms)
+    # Count everything in C first, then check exclusions once per distinct token
+    token_counts = Counter(tokens)
+    if excluded_terms:
+        for token in [token for token in token_counts if token.lower() in excluded_terms]:
+            del token_counts[token]
+    
+    # most_common(n) keeps only a bounded heap when a limit is given, and only
+    # listed tokens need contexts
+    ranked_tokens = token_counts.most_common(top_n)
     
     # Prepare sentence contexts if context flag is enabled
     sentence_contexts = {}
     if context_flag:
         sentences = split_sentences(normalized_text)
+        # Tokenize each sentence once with the same tokenizer as the full text, so
+        # checking whether a form occurs in a sentence is a set lookup
+        sentence_words = [set(tokenize(sentence)) for sentence in sentences]
+        
+        # Index the sentences each form occurs in, by sentence number
+        form_sentence_ids = {}
+        for sentence_id, words in enumerate(sentence_words):
+            for word in words:
+                form_sentence_ids.setdefault(word, []).append(sentence_id)
         
-        for processed_token in token_counts.keys():
+        # Invert the mapping so each processed token knows the original forms behind it
+        processed_to_original_forms = {}
+        for orig_token, possible_lemmas in original_to_processed_map.items():
+            for lemma in dict.fromkeys(possible_lemmas):
+                processed_to_original_forms.setdefault(lemma, []).append(orig_token)
+        
+        for processed_token, _ in ranked_tokens:
             contexts = []
+            original_forms = processed_to_original_forms.get(processed_token, [])
             
-            # For each sentence, check if it contains any original tokens that map to this processed token
-            for sentence in sentences:
-                sentence_lower = sentence.lower()
-                
+            # Only sentences containing one of the forms are candidates, earliest first
+            candidate_ids = sorted({
+                sentence_id
+                for orig_token in original_forms
+                for sentence_id in form_sentence_ids.get(orig_token, ())
+            })
+            
+            for sentence_id in candidate_ids:
+                sentence = sentences[sentence_id]
+                words = sentence_words[sentence_id]
                 # Find original tokens that map to the current processed token and appear in this sentence
-                found_original_forms = []
-                for orig_token, possible_lemmas in original_to_processed_map.items():
-                    if processed_token in possible_lemmas:  # Check if this processed token is in the list of possible lemmas
-                        # Check if this original token appears as a whole word in the sentence
-                        pattern = r'\b' + re.escape(orig_token.lower()) + r'\b'
-                        if re.search(pattern, sentence_lower):
-                            found_original_forms.append(orig_token)
+                found_original_forms = [orig_token for orig_token in original_forms if orig_token in words]
                 
                 # If we found original forms in this sentence, create the highlighted context
                 if found_original_forms:
-                    highlighted_sentence = sentence
-                    # Highlight the first matching original form found in the sentence
-                    # (to avoid overlapping replacements)
-                    for orig_form in found_original_forms:
-                        pattern = r'\b' + re.escape(orig_form) + r'\b'
-                        highlighted_sentence = re.sub(
-                            pattern,
-                            f"<b>{orig_form}</b>",
-                            highlighted_sentence,
-                            flags=re.IGNORECASE
-                        )
+                    # Highlight every matching form in one pass over the sentence. Longer
+                    # forms are tried first, and text inside inserted tags is never
+                    # matched again.
+                    highlighted_sentence, matches = _bold_forms(sentence, tuple(found_original_forms))
+                    # The tokenizer also finds words inside "test42" or "snake_case",
+                    # which are not whole words to the highlighter; a sentence with
+                    # nothing to bold is not a context
+                    if not matches:
+                        continue
                     
                     # Replace newlines with <br> tags for proper formatting
                     highlighted_sentence = highlighted_sentence.replace('\n', '<br>').replace('\r', '<br>')
@@ -397,7 +527,7 @@ def _format_output(
             sentence_contexts[processed_token] = contexts
     
     # Build output for each token based on active flags
-    for token, count in sorted(token_counts.items(), key=lambda x: x[1], reverse=True):
+    for token, count in ranked_tokens:
         output_parts = [token]
         
         # Add frequency if flag is set
@@ -406,8 +536,9 @@ def _format_output(
         
         # Add context if flag is set and contexts were found
         if context_flag and sentence_contexts.get(token):
-            context_str = ", ".join([f'"{c}"' for c in sentence_contexts[token]])
-            output_parts.append(f"[{context_str}]")
+            # Quote and separate the contexts in a single join, without a
+            # formatted string per context
+            output_parts.append('["' + '", "'.join(sentence_contexts[token]) + '"]')
         
         # Join parts with semicolons
         result_lines.append("; ".join(output_parts))
@@ -415,22 +546,69 @@ def _format_output(
     return "\n".join(result_lines) + "\n"
 
 
+@lru_cache(maxsize=4096)
+def _highlight_pattern(forms: Tuple[str, ...]) -> "re.Pattern":
+    """Compile a case-insensitive whole-word pattern matching any of forms, longest first."""
+    alternatives = '|'.join(map(re.escape, sorted(forms, key=len, reverse=True)))
+    # Lookarounds rather than \b, which needs a word character on one side and so
+    # never matches after a form ending in a combining mark such as "नमः"
+    return re.compile(r'(?<!\w)(?:' + alternatives + r')(?!\w)', re.IGNORECASE)
+
+
+def _is_mark(char: str) -> bool:
+    """Return whether char is a combining mark (Mn, Mc), which continues a word."""
+    return unicodedata.category(char) in ('Mn', 'Mc')
+
+
+def _bold_forms(sentence: str, forms: Tuple[str, ...]) -> Tuple[str, int]:
+    """Wrap each whole-word occurrence of forms in <b> tags; return the text and the count."""
+    pattern = _highlight_pattern(forms)
+    if sentence.isascii():
+        return pattern.subn(r'<b>\g<0></b>', sentence)
+    
+    bolded = 0
+    
+    def bold(match):
+        nonlocal bolded
+        start, end = match.span()
+        # re treats combining marks as non-word characters, so a match may start or
+        # end inside a word, e.g. "धम" in "धम्म"; leave those unchanged
+        if (start and _is_mark(sentence[start - 1])) or (end < len(sentence) and _is_mark(sentence[end])):
+            return match.group()
+        bolded += 1
+        return '<b>' + match.group() + '</b>'
+    
+    return pattern.sub(bold, sentence), bolded
+
+
 def split_sentences(text: str) -> List[str]:
     """Basic sentence tokenizer."""
-    sentences = re.split(r"(?<!\b[A-Z]\.)(?<!\b[A-Z][a-z]\.)(?<=[.!?])\s+", text)
+    # Without sentence-ending punctuation there is nothing to split, so skip the
+    # look-behind regex entirely
+    if '.' not in text and '!' not in text and '?' not in text:
+        text = text.strip()
+        return [text] if text else []
+    sentences = _SENT_SPLIT_RE.split(text)
     return [s.strip() for s in sentences if s.strip()]
 
 
 def get_available_languages():
     """Get a list of all available languages (plugins only + base)."""
-    # Use the consistent function for entry points
-    language_eps = get_entry_points()
-    
-    available_languages = ['base']  # Add base as always available
-    for ep in language_eps:
-        available_languages.append(ep.name)
-    
-    return sorted(set(available_languages))  # Use set to avoid duplicates
+    return list(_discover_languages())
+
+
+@lru_cache(maxsize=1)
+def _discover_languages() -> tuple:
+    """List base plus every installed plugin language, once per process."""
+    available_languages = {'base', *_get_language_eps()}  # Add base as always available
+    return tuple(sorted(available_languages))
+
+
+def clear_language_cache() -> None:
+    """Forget discovered languages, e.g. after installing or removing a plugin."""
+    _discover_languages.cache_clear()
+    _get_language_eps.cache_clear()
+    _language_spec_cache.clear()
 
 
 def cleanup_db_connections():
@@ -439,3 +617,7 @@ def cleanup_db_connections():
     for conn in _db_cache.values():
         conn.close()
     _db_cache.clear()
+    _lemma_cache.clear()
+
+
+atexit.register(cleanup_db_connections)
@@ -18,17 +18,26 @@
 
 import sys
 
+# ANSI colour escapes shared by every message helper
+_RED = "\033[31m"
+_YELLOW = "\033[33m"
+_GREEN = "\033[32m"
+_RESET = "\033[0m"
+
+# Reset plus newline, so each message is written with a single call
+_END = _RESET + "\n"
+
 
 def print_error(message: str) -> None:
     """Print error message to stderr in red."""
-    print(f"\033[31m{message}\033[0m", file=sys.stderr)
+    sys.stderr.write(_RED + message + _END)
 
 
 def print_warning(message: str) -> None:
     """Print warning message to stderr in yellow."""
-    print(f"\033[33m{message}\033[0m", file=sys.stderr)
+    sys.stderr.write(_YELLOW + message + _END)
 
 
 def print_success(message: str) -> None:
     """Print success message to stdout in green."""
-    print(f"\033[32m{message}\033[0m")
+    sys.stdout.write(_GREEN + message + _END)
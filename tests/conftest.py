@@ -39,6 +39,13 @@ def mock_config_dir(tmp_path, monkeypatch):
     
     # Mock the function in the config module
     monkeypatch.setattr('blitzer_cli.config.get_config_dir', mock_get_config_dir)
+    
+    # data_manager imports get_config_dir by name and memoizes the paths it builds,
+    # so patch its reference too and drop anything cached by earlier tests
+    from blitzer_cli import data_manager
+    monkeypatch.setattr(data_manager, 'get_config_dir', mock_get_config_dir)
+    monkeypatch.setattr(data_manager, '_created_dirs', set())
+    data_manager._language_data_path.cache_clear()
     return tmp_path / 'blitzer'
 
 
@@ -50,3 +57,42 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "unit: mark test as unit test"
     )
+
+
+@pytest.fixture
+def lemma_db(tmp_path):
+    """Create a small lemma database in the schema language packs ship."""
+    import sqlite3
+    from blitzer_cli.processor import cleanup_db_connections
+    
+    db_path = tmp_path / 'lemmas.db'
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE Lemmas (id INTEGER PRIMARY KEY, lemma TEXT);
+        CREATE TABLE Forms (id INTEGER PRIMARY KEY, form_representation TEXT, lemma_id INTEGER);
+        INSERT INTO Lemmas (id, lemma) VALUES (1, 'biti'), (2, 'hiša'), (3, 'Ljubljana'), (4, 'jesti');
+        INSERT INTO Forms (form_representation, lemma_id) VALUES
+            ('sem', 1), ('je', 1), ('so', 1),
+            ('hiša', 2), ('hiše', 2),
+            ('Ljubljana', 3), ('Ljubljani', 3),
+            ('je', 4);
+    """)
+    conn.commit()
+    conn.close()
+    yield str(db_path)
+    cleanup_db_connections()
+
+
+@pytest.fixture
+def pip_calls(monkeypatch):
+    """Replace subprocess.run with a successful stub and record each command it gets."""
+    import subprocess
+    
+    calls = []
+    
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+    
+    monkeypatch.setattr(subprocess, 'run', fake_run)
+    return calls
@@ -16,10 +16,12 @@
 
 """Tests for the CLI module."""
 import pytest
+import io
+import os
 import sys
 from io import StringIO
 from click.testing import CliRunner
-from blitzer_cli.cli import cli, blitz
+from blitzer_cli.cli import cli, blitz, read_stdin, validate_language_code, write_output
 
 
 class TestCLI:
@@ -45,6 +47,20 @@ class TestCLI:
         assert 'test; 2' in result.output
         assert 'word; 1' in result.output
     
+    def test_blitz_command_with_top_option(self):
+        """Test that --top limits output to the most frequent words."""
+        runner = CliRunner()
+        result = runner.invoke(blitz, ['-n', '-l', 'base', '-t', 'c b a b a a b. c a', '-f', '-c', '--top', '2'])
+        
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            'a; 4; ["c b <b>a</b> b <b>a</b> <b>a</b> b.", "c <b>a</b>"]',
+            'b; 3; ["c <b>b</b> a <b>b</b> a a <b>b</b>."]',
+        ]
+        
+        result = runner.invoke(blitz, ['-n', '-l', 'base', '-t', 'test', '--top', '0'])
+        assert result.exit_code != 0
+    
     def test_blitz_command_with_lemmatize_flag_base_language(self):
         """Test blitz command with lemmatize flag using base language (should show warning)."""
         runner = CliRunner()
@@ -97,3 +113,130 @@ class TestCLI:
         assert 'Blitzer CLI: Vocabulary extraction for language learners' in result.output
         assert 'blitz' in result.output
         assert 'languages' in result.output
+    
+    def test_languages_install_batches_packs(self, pip_calls):
+        """Test that installing several packs spawns a single pip process."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['languages', 'install', 'pli', 'slv'])
+        
+        assert result.exit_code == 0
+        assert len(pip_calls) == 1
+        assert pip_calls[0][:4] == [sys.executable, '-m', 'pip', '--disable-pip-version-check']
+        assert pip_calls[0][-3:] == ['install', 'blitzer-language-pli', 'blitzer-language-slv']
+    
+    def test_languages_uninstall_runs_pip_uninstall(self, pip_calls):
+        """Test that uninstall invokes pip uninstall rather than install."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['languages', 'uninstall', 'pli'])
+        
+        assert result.exit_code == 0
+        assert pip_calls[0][:4] == [sys.executable, '-m', 'pip', '--disable-pip-version-check']
+        assert pip_calls[0][-3:] == ['uninstall', '-y', 'blitzer-language-pli']
+    
+    def test_languages_install_does_not_load_processor(self, monkeypatch, pip_calls):
+        """Test that a successful install only refreshes a processor that is already loaded."""
+        monkeypatch.delitem(sys.modules, 'blitzer_cli.processor', raising=False)
+        runner = CliRunner()
+        result = runner.invoke(cli, ['languages', 'install', 'pli'])
+        
+        assert result.exit_code == 0
+        assert 'blitzer_cli.processor' not in sys.modules
+    
+    def test_languages_install_rejects_invalid_code(self, pip_calls):
+        """Test that an invalid language code aborts before calling pip."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['languages', 'install', 'pli', 'SLV'])
+        
+        assert result.exit_code != 0
+        assert pip_calls == []
+    
+    def test_blitz_command_stdin_whitespace_trimmed(self):
+        """Test that stdin input is decoded as UTF-8 and surrounding whitespace ignored."""
+        runner = CliRunner()
+        result = runner.invoke(blitz, ['-l', 'base', '--freq'], input='\n\n  café café  \n\n'.encode('utf-8'))
+        
+        assert result.exit_code == 0
+        assert result.output == 'café; 2\n'
+    
+    def test_blitz_command_whitespace_only_stdin(self):
+        """Test that whitespace-only stdin counts as no input."""
+        runner = CliRunner()
+        result = runner.invoke(blitz, ['-l', 'base'], input=' \n\t\n')
+        
+        assert result.exit_code != 0
+        
+        # Unicode whitespace is trimmed the same way as text given with -t
+        result = runner.invoke(blitz, ['-l', 'base'], input='\u00a0\n\u2003'.encode('utf-8'))
+        
+        assert result.exit_code != 0
+        assert 'No input text provided' in result.output
+    
+    def test_read_stdin_text_only_stream(self, monkeypatch):
+        """Test that stdin without a byte buffer is read as text and stripped."""
+        monkeypatch.setattr(sys, 'stdin', StringIO('\u00a0 café vode \n'))
+        
+        assert read_stdin() == 'café vode'
+    
+    def test_write_output_text_only_stream(self, monkeypatch):
+        """Test that output goes through write() on streams without a byte buffer."""
+        stream = StringIO()
+        monkeypatch.setattr(sys, 'stdout', stream)
+        
+        write_output('café; 2\n')
+        
+        assert stream.getvalue() == 'café; 2\n'
+    
+    def test_write_output_translates_newlines(self, monkeypatch):
+        """Test that the byte path applies the platform line separator."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding='utf-8')
+        monkeypatch.setattr(sys, 'stdout', stream)
+        monkeypatch.setattr(os, 'linesep', '\r\n')
+        
+        write_output('café\nvoda\n')
+        
+        assert raw.getvalue() == 'café\r\nvoda\r\n'.encode('utf-8')
+    
+    def test_validate_language_code(self):
+        """Test language code validation accepts only three lowercase ASCII letters."""
+        assert validate_language_code('pli')
+        assert validate_language_code('slv')
+        assert not validate_language_code('')
+        assert not validate_language_code('sl')
+        assert not validate_language_code('slvx')
+        assert not validate_language_code('SLV')
+        assert not validate_language_code('sl1')
+        assert not validate_language_code('slv\n')
+        assert not validate_language_code('slé')
+    
+    def test_blitz_command_skips_config_when_fully_specified(self, monkeypatch, tmp_path):
+        """Test that no config is read when every flag and the exclusion list are given."""
+        monkeypatch.setattr('blitzer_cli.processor._exclusion_overrides', {})
+        
+        def fail_load_config(*args, **kwargs):
+            raise AssertionError("config should not be loaded")
+        
+        monkeypatch.setattr('blitzer_cli.cli.load_config', fail_load_config)
+        exclusion_file = tmp_path / 'base_exclusion.txt'
+        exclusion_file.write_text('is\n', encoding='utf-8')
+        
+        runner = CliRunner()
+        result = runner.invoke(blitz, [
+            '-l', 'base', '-t', 'this is a test',
+            '--no-lemmatize', '--freq', '--no-context', '--no-prompt', '--no-src',
+            '-e', f'base:{exclusion_file}',
+        ])
+        
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert 'this; 1' in lines
+        assert 'is; 1' not in lines
+    
+    def test_blitz_command_invalid_utf8_stdin(self):
+        """Test that invalid UTF-8 on stdin is replaced instead of crashing."""
+        runner = CliRunner()
+        result = runner.invoke(blitz, ['-l', 'base'], input=b'good \xff word')
+        
+        assert result.exit_code == 0
+        assert 'good' in result.output
+        assert 'word' in result.output
@@ -68,3 +68,76 @@ class TestConfig:
         assert '[prompts]' in content
         assert '"base" = "Convert the following wordlist into tab separated anki cards."' in content
         assert '"en" = "Convert the following wordlist into tab separated anki cards."' in content
+    
+    def test_load_config_reuses_parse_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that a config file is only re-parsed after it changes on disk."""
+        from blitzer_cli import config as config_module
+        
+        config_file = tmp_path / 'custom.toml'
+        config_file.write_text('default_freq = true\n[prompts]\nbase = "x"\n', encoding='utf-8')
+        
+        first = load_config(config_path=config_file, use_default_config=False)
+        assert first == {'default_freq': True, 'prompts': {'base': 'x'}}
+        
+        # Unchanged file should be served from the parse cache
+        def fail_parse(config_file):
+            raise AssertionError("TOML should not be parsed")
+        
+        with monkeypatch.context() as m:
+            m.setattr(config_module, '_parse_toml', fail_parse)
+            second = load_config(config_path=config_file, use_default_config=False)
+        assert second == first
+        
+        # Each caller gets an independent copy of the cached config
+        second['prompts']['base'] = 'changed'
+        assert load_config(config_path=config_file, use_default_config=False) == first
+        
+        config_file.write_text('default_freq = false\ndefault_src = true\n', encoding='utf-8')
+        third = load_config(config_path=config_file, use_default_config=False)
+        assert third == {'default_freq': False, 'default_src': True}
+    
+    def test_load_config_reuses_snapshot_across_processes(self, mock_config_dir, monkeypatch):
+        """Test that an unchanged default config is served from its JSON snapshot."""
+        from blitzer_cli import config as config_module
+        
+        load_config()  # first run writes the default file
+        first = load_config()
+        assert (mock_config_dir / 'config.cache.json').exists()
+        
+        # Simulate a fresh process that must not need the TOML parser
+        config_module._parse_config.cache_clear()
+        
+        def fail_parse(config_file):
+            raise AssertionError("TOML should not be parsed")
+        
+        monkeypatch.setattr(config_module, '_parse_toml', fail_parse)
+        assert load_config() == first
+    
+    def test_default_config_dict_matches_default_file(self):
+        """Test that the in-memory default equals what the default file parses to."""
+        from blitzer_cli import config as config_module
+        
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib
+        
+        assert tomllib.loads(config_module._DEFAULT_CONFIG_TEXT) == config_module._DEFAULT_CONFIG
+    
+    def test_load_config_first_run_returns_independent_copy(self, mock_config_dir):
+        """Test that the first-run default can be modified without affecting later loads."""
+        config = load_config()
+        assert (mock_config_dir / 'config.toml').exists()
+        
+        config['prompts']['base'] = 'changed'
+        assert load_config()['prompts']['base'] != 'changed'
+    
+    def test_load_config_existing_file_skips_mkdir(self, mock_config_dir, monkeypatch):
+        """Test that loading an existing default config does not create directories."""
+        load_config()  # first run creates the directory and default file
+        
+        def fail_mkdir(self, *args, **kwargs):
+            raise AssertionError("mkdir should not be called")
+        
+        monkeypatch.setattr(Path, 'mkdir', fail_mkdir)
+        assert load_config()['default_freq'] is False
@@ -19,7 +19,7 @@ import os
 import tempfile
 from pathlib import Path
 import pytest
-from blitzer_cli.data_manager import get_language_data_dir, get_language_data_path, ensure_language_data
+from blitzer_cli.data_manager import get_language_data_dir, get_language_data_path, ensure_language_data, download_language_data
 
 
 class TestDataManager:
@@ -42,3 +42,26 @@ class TestDataManager:
         """Test ensure language data when file doesn't exist and no URL provided."""
         result = ensure_language_data('test_lang', 'nonexistent.db', url=None)
         assert result is None
+    
+    def test_download_language_data_streams_to_file(self, mock_config_dir, monkeypatch):
+        """Test that downloads are written chunk by chunk and leave no partial file."""
+        class FakeResponse:
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                return False
+            
+            def raise_for_status(self):
+                pass
+            
+            def iter_content(self, chunk_size):
+                yield b'first-'
+                yield b'second'
+        
+        monkeypatch.setattr('requests.get', lambda url, stream: FakeResponse())
+        path = download_language_data('https://example.invalid/lexicon.db', 'test_lang', 'lexicon.db')
+        
+        assert path.read_bytes() == b'first-second'
+        assert not path.with_name('lexicon.db.part').exists()
+        assert get_language_data_path('test_lang', 'lexicon.db') == path
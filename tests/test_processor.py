@@ -18,7 +18,7 @@
 import pytest
 import sys
 from io import StringIO
-from blitzer_cli.processor import process_text, get_language_spec, get_available_languages
+from blitzer_cli.processor import process_text, get_language_spec, get_available_languages, sql_lemmatize_tokens_with_mapping
 
 
 class TestProcessor:
@@ -85,3 +85,217 @@ class TestProcessor:
         languages = get_available_languages()
         assert 'base' in languages
         assert isinstance(languages, list)
+    
+    def test_prompt_flag_without_configured_prompt_warns(self, mock_config_dir, capfd):
+        """Test that --prompt without a configured prompt warns in yellow and is ignored."""
+        mock_config_dir.mkdir(parents=True, exist_ok=True)
+        (mock_config_dir / 'config.toml').write_text('[prompts]\n', encoding='utf-8')
+        
+        result = process_text("a test", "base", prompt_flag=True)
+        
+        captured = capfd.readouterr()
+        assert 'PROMPT:' not in result
+        assert 'No language-specific prompt configured' in captured.err
+        assert '\033[33m' in captured.err  # Yellow color code
+    
+    def test_sql_lemmatize_tokens_with_mapping(self, lemma_db):
+        """Test SQL lemmatization maps every form to all of its lemmas."""
+        tokens = ['je', 'hiše', 'ljubljani', 'neznano', 'je']
+        all_lemmas, mapping = sql_lemmatize_tokens_with_mapping(tokens, lemma_db)
+        
+        assert sorted(mapping['je']) == ['biti', 'jesti']
+        assert mapping['hiše'] == ['hiša']
+        # Lookup is case-insensitive against the stored forms
+        assert mapping['ljubljani'] == ['Ljubljana']
+        # Unknown forms map to themselves
+        assert mapping['neznano'] == ['neznano']
+        assert sorted(all_lemmas) == sorted(['biti', 'jesti', 'hiša', 'Ljubljana', 'neznano', 'biti', 'jesti'])
+        
+        # A second call reuses the cached connection and gives the same answer
+        assert sql_lemmatize_tokens_with_mapping(tokens, lemma_db) == (all_lemmas, mapping)
+    
+    def test_get_exclusion_terms_from_override(self, tmp_path, monkeypatch):
+        """Test that an exclusion file is read into a lowercased frozenset."""
+        from blitzer_cli import processor
+        
+        exclusion_file = tmp_path / 'base_exclusion.txt'
+        exclusion_file.write_text('The\n\n  Is  \nthe\n', encoding='utf-8')
+        monkeypatch.setattr(processor, '_exclusion_overrides', {'base': str(exclusion_file)})
+        
+        terms = processor.get_exclusion_terms('base')
+        assert terms == frozenset({'the', 'is'})
+        assert isinstance(terms, frozenset)
+    
+    def test_find_words_ascii_fast_path_matches_regex(self):
+        """Test that the ASCII tokenizer fast path agrees with the regex tokenizer."""
+        from blitzer_cli.processor import _find_words, _WORD_RE, _LETTER_TABLE
+        
+        ascii_text = "It's a test-case;\tnumbers 42x, snake_case\x1cand\x00more.\n\nEnd!"
+        assert _find_words(ascii_text) == _WORD_RE.findall(ascii_text.translate(_LETTER_TABLE))
+        assert _find_words(ascii_text) == ['It', 's', 'a', 'test', 'case', 'numbers', 'x',
+                                           'snake', 'case', 'and', 'more', 'End']
+        
+        unicode_text = "Čaša vode, hiše in Ljubljana."
+        assert _find_words(unicode_text) == ['Čaša', 'vode', 'hiše', 'in', 'Ljubljana']
+    
+    def test_sql_lemmatize_reuses_cached_forms(self, lemma_db):
+        """Test that forms looked up once are served from the lemma cache."""
+        import sqlite3
+        from blitzer_cli.processor import cleanup_db_connections
+        
+        assert sql_lemmatize_tokens_with_mapping(['hiše', 'neznano'], lemma_db)[1]['hiše'] == ['hiša']
+        
+        conn = sqlite3.connect(lemma_db)
+        conn.execute("DELETE FROM Forms WHERE form_representation = 'hiše'")
+        conn.commit()
+        conn.close()
+        
+        # Cached forms, including unknown ones, are not queried again
+        _, mapping = sql_lemmatize_tokens_with_mapping(['hiše', 'neznano', 'sem'], lemma_db)
+        assert mapping == {'hiše': ['hiša'], 'neznano': ['neznano'], 'sem': ['biti']}
+        
+        # Cleanup drops the cache along with the connections
+        cleanup_db_connections()
+        assert sql_lemmatize_tokens_with_mapping(['hiše'], lemma_db)[1]['hiše'] == ['hiše']
+    
+    def test_sql_lemmatize_mapping_does_not_share_cached_lemmas(self, lemma_db):
+        """Test that changing a returned mapping leaves the lemma cache intact."""
+        _, mapping = sql_lemmatize_tokens_with_mapping(['hiše', 'Hiše'], lemma_db)
+        mapping['hiše'].append('junk')
+        assert mapping['Hiše'] == ['hiša']
+        
+        _, mapping = sql_lemmatize_tokens_with_mapping(['hiše'], lemma_db)
+        assert mapping == {'hiše': ['hiša']}
+    
+    def test_db_connection_is_read_only(self, lemma_db, tmp_path):
+        """Test that lexicon databases are opened read-only and never created."""
+        import sqlite3
+        from blitzer_cli.processor import get_db_connection
+        
+        with get_db_connection(lemma_db) as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM Forms")
+        
+        missing_db = tmp_path / 'missing.db'
+        with pytest.raises(sqlite3.OperationalError):
+            sql_lemmatize_tokens_with_mapping(['je'], str(missing_db))
+        assert not missing_db.exists()
+    
+    def test_lemmatized_context_output(self, lemma_db, monkeypatch):
+        """Test that lemmatized output finds and highlights every form of a lemma in context."""
+        from blitzer_cli import processor
+        
+        monkeypatch.setattr(processor, 'get_language_spec', lambda code: {
+            "db_path": lemma_db, "normalizer": None, "tokenizer": None, "custom_lemmatizer": None
+        })
+        text = "Hiša je lepa. V Ljubljani so hiše! Jaz sem doma.\nTo je vse."
+        result = process_text(text, "slv", lemmatize_flag=True, freq_flag=True, context_flag=True)
+        
+        assert result.splitlines() == [
+            'biti; 4; ["hiša <b>je</b> lepa.", "v ljubljani <b>so</b> hiše!"]',
+            'hiša; 2; ["<b>hiša</b> je lepa.", "v ljubljani so <b>hiše</b>!"]',
+            'jesti; 2; ["hiša <b>je</b> lepa.", "to <b>je</b> vse."]',
+            'lepa; 1; ["hiša je <b>lepa</b>."]',
+            'v; 1; ["<b>v</b> ljubljani so hiše!"]',
+            'Ljubljana; 1; ["v <b>ljubljani</b> so hiše!"]',
+            'jaz; 1; ["<b>jaz</b> sem doma."]',
+            'doma; 1; ["jaz sem <b>doma</b>."]',
+            'to; 1; ["<b>to</b> je vse."]',
+            'vse; 1; ["to je <b>vse</b>."]',
+        ]
+    
+    def test_get_language_spec_loads_plugin_once(self, monkeypatch):
+        """Test that a plugin's register() runs once until the language cache is cleared."""
+        from blitzer_cli import processor
+        
+        calls = []
+        
+        class FakeEntryPoint:
+            name = 'xyz'
+            
+            def load(self):
+                calls.append(self.name)
+                return lambda: {"db_path": None, "normalizer": None, "tokenizer": None, "custom_lemmatizer": None}
+        
+        monkeypatch.setattr(processor, 'get_entry_points', lambda: [FakeEntryPoint()])
+        processor.clear_language_cache()
+        try:
+            assert get_language_spec('xyz') is get_language_spec('xyz')
+            assert calls == ['xyz']
+            assert get_available_languages() == ['base', 'xyz']
+            
+            processor.clear_language_cache()
+            get_language_spec('xyz')
+            assert calls == ['xyz', 'xyz']
+        finally:
+            # Don't leak the fake plugin into later tests
+            monkeypatch.undo()
+            processor.clear_language_cache()
+    
+    def test_context_highlights_all_forms_in_one_pass(self, monkeypatch):
+        """Test that highlighting several forms never rewrites inserted tags."""
+        from blitzer_cli import processor
+        
+        monkeypatch.setattr(processor, 'get_language_spec', lambda code: {
+            "db_path": None, "normalizer": None, "tokenizer": None,
+            "custom_lemmatizer": lambda tokens: ['be' if token in ('b', 'be') else token for token in tokens],
+        })
+        result = process_text("Be b.", "xyz", lemmatize_flag=True, context_flag=True)
+        
+        assert result.splitlines() == ['be; ["<b>be</b> <b>b</b>."]']
+    
+    def test_context_skips_sentences_without_whole_word_match(self):
+        """Test that a form found only inside a longer word does not take a context slot."""
+        result = process_text("test42 is odd. A test here. The test ends.", "base",
+                              freq_flag=True, context_flag=True)
+        assert result.splitlines()[0] == 'test; 3; ["a <b>test</b> here.", "the <b>test</b> ends."]'
+        
+        result = process_text("snake_case wins. A snake here.", "base", context_flag=True)
+        lines = result.splitlines()
+        assert 'snake; ["a <b>snake</b> here."]' in lines
+        assert 'case' in lines
+    
+    def test_context_highlights_words_with_combining_marks(self):
+        """Test that words ending in or containing combining marks are highlighted whole."""
+        result = process_text("नमः गुरवे। नमः सर्वे. धम्म धम!", "base", freq_flag=True, context_flag=True)
+        lines = result.splitlines()
+        
+        assert 'नमः; 2; ["<b>नमः</b> गुरवे। <b>नमः</b> सर्वे."]' in lines
+        assert 'गुरवे; 1; ["नमः <b>गुरवे</b>। नमः सर्वे."]' in lines
+        assert 'धम; 1; ["धम्म <b>धम</b>!"]' in lines
+    
+    def test_split_sentences(self):
+        """Test sentence splitting with and without sentence-ending punctuation."""
+        from blitzer_cli.processor import split_sentences
+        
+        assert split_sentences("One. Two!  Three? four") == ["One.", "Two!", "Three?", "four"]
+        assert split_sentences("  no punctuation here \n") == ["no punctuation here"]
+        assert split_sentences(" \n ") == []
+    
+    def test_get_exclusion_terms_reloads_changed_file(self, tmp_path, monkeypatch):
+        """Test that exclusion terms are cached until the file changes."""
+        import os
+        from blitzer_cli import processor
+        
+        exclusion_file = tmp_path / 'base_exclusion.txt'
+        exclusion_file.write_text('the\n', encoding='utf-8')
+        monkeypatch.setattr(processor, '_exclusion_overrides', {'base': str(exclusion_file)})
+        
+        first = processor.get_exclusion_terms('base')
+        assert processor.get_exclusion_terms('base') is first
+        
+        exclusion_file.write_text('the\nis\n', encoding='utf-8')
+        os.utime(exclusion_file, ns=(0, 0))
+        assert processor.get_exclusion_terms('base') == frozenset({'the', 'is'})
+    
+    def test_regex_tokenize_letters_in_any_script(self):
+        """Test that the fallback tokenizer keeps letters from any script and drops symbols."""
+        from blitzer_cli.processor import regex_tokenize
+        
+        assert regex_tokenize("Čaša × 2 vode; Привет, мир! bhagavā_ñāṇa") == [
+            'čaša', 'vode', 'привет', 'мир', 'bhagavā', 'ñāṇa'
+        ]
+        # Combining marks such as the virama stay inside the word
+        assert regex_tokenize("धम्म, संघ।") == ['धम्म', 'संघ']
+        # Superscripts, fractions and Roman numeral signs are numbers, not letters
+        assert regex_tokenize("x² ½ Ⅻ") == ['x']